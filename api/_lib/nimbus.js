@@ -0,0 +1,84 @@
+// Shared Nimbus AI configuration for the api/nimbus endpoints
+// Agent definitions and service health both derive from which API keys are
+// configured; keeping them here lets the agents, health, and dashboard
+// endpoints report from one source instead of drifting copies.
+
+// Agent definitions are constant for the life of a process — key presence
+// can't change under a running instance — so the array is built once at
+// module load instead of reallocating four objects per request. Callers
+// treat it as read-only.
+const DEFAULT_AGENTS = [
+  {
+    agent_id: 'gpt4',
+    name: 'GPT-4 Assistant',
+    description: 'Advanced AI assistant powered by OpenAI GPT-4, excellent for complex reasoning and detailed responses',
+    capabilities: ['reasoning', 'writing', 'analysis', 'coding', 'creative tasks'],
+    inputs: ['user_message', 'context'],
+    outputs: ['response', 'reasoning'],
+    status: process.env.OPENAI_API_KEY ? 'active' : 'inactive',
+    escalates_to_human: false,
+    model: 'gpt-4',
+    provider: 'openai'
+  },
+  {
+    agent_id: 'claude',
+    name: 'Claude Assistant',
+    description: 'Anthropic Claude AI, known for helpful, harmless, and honest responses with strong analytical capabilities',
+    capabilities: ['analysis', 'writing', 'reasoning', 'research', 'summarization'],
+    inputs: ['user_message', 'context'],
+    outputs: ['response', 'analysis'],
+    status: process.env.ANTHROPIC_API_KEY ? 'active' : 'inactive',
+    escalates_to_human: false,
+    model: 'claude-3-5-sonnet-20240620',
+    provider: 'anthropic'
+  },
+  {
+    agent_id: 'grok',
+    name: 'Grok Assistant',
+    description: 'xAI Grok AI with real-time information access and conversational abilities',
+    capabilities: ['conversation', 'real-time info', 'humor', 'current events'],
+    inputs: ['user_message', 'context'],
+    outputs: ['response', 'real_time_data'],
+    status: process.env.XAI_GROK_API_KEY ? 'active' : 'inactive',
+    escalates_to_human: false,
+    model: 'grok-beta',
+    provider: 'xai'
+  },
+  {
+    agent_id: 'nimbus',
+    name: 'Nimbus Multi-Agent',
+    description: 'Intelligent routing system that selects the best AI agent for each query',
+    capabilities: ['agent_routing', 'multi_agent_coordination', 'fallback_handling'],
+    inputs: ['user_message', 'context', 'preferred_agent'],
+    outputs: ['response', 'agent_used', 'routing_decision'],
+    status: 'active',
+    escalates_to_human: true,
+    model: 'multi-agent-router',
+    provider: 'nimbus'
+  }
+];
+
+const getDefaultAgents = () => DEFAULT_AGENTS;
+
+const getServiceHealth = () => [
+  {
+    service: 'openai',
+    status: process.env.OPENAI_API_KEY ? 'healthy' : 'unhealthy',
+    response_time_ms: 150,
+    last_checked: new Date().toISOString()
+  },
+  {
+    service: 'claude',
+    status: process.env.ANTHROPIC_API_KEY ? 'healthy' : 'unhealthy',
+    response_time_ms: 200,
+    last_checked: new Date().toISOString()
+  },
+  {
+    service: 'grok',
+    status: process.env.XAI_GROK_API_KEY ? 'healthy' : 'unhealthy',
+    response_time_ms: 180,
+    last_checked: new Date().toISOString()
+  }
+];
+
+module.exports = { getDefaultAgents, getServiceHealth };
@@ -0,0 +1,84 @@
+// Shared posts.json access for the Vercel API routes
+// Files under api/_lib are not exposed as endpoints.
+const fs = require('fs');
+const path = require('path');
+
+const postsPath = () => path.join(process.cwd(), 'public', 'posts.json');
+
+// Parsing posts.json is deterministic for a given file version, so cache the
+// parsed array per warm serverless instance and key it by mtime — identical
+// reads skip the read+parse entirely.
+let cachedPosts = null;
+let cachedMtimeMs = 0;
+
+const loadPosts = () => {
+  try {
+    const filePath = postsPath();
+    if (!fs.existsSync(filePath)) {
+      return [];
+    }
+    const { mtimeMs } = fs.statSync(filePath);
+    if (cachedPosts && mtimeMs === cachedMtimeMs) {
+      return cachedPosts;
+    }
+    const data = fs.readFileSync(filePath, 'utf8');
+    cachedPosts = JSON.parse(data);
+    cachedMtimeMs = mtimeMs;
+    return cachedPosts;
+  } catch (error) {
+    console.error('Error loading posts:', error);
+    return [];
+  }
+};
+
+const savePosts = (posts) => {
+  try {
+    const filePath = postsPath();
+    const data = JSON.stringify(posts, null, 2);
+    fs.writeFileSync(filePath, data, 'utf8');
+    // Keep the cache coherent with what was just written. The write
+    // endpoints mutate the loaded array in place, so any id index built
+    // before the save is stale — drop it and let the next lookup rebuild.
+    idIndexCache.delete(posts);
+    cachedPosts = posts;
+    cachedMtimeMs = fs.statSync(filePath).mtimeMs;
+    return true;
+  } catch (error) {
+    console.error('Error saving posts:', error);
+    return false;
+  }
+};
+
+// Id lookup index per cached posts array. The WeakMap key is the array
+// identity, so the index is rebuilt exactly when loadPosts returns a fresh
+// parse and single-post reads on a warm instance are one Map.get.
+const idIndexCache = new WeakMap();
+
+const findPostById = (posts, id) => {
+  let index = idIndexCache.get(posts);
+  if (!index) {
+    index = new Map(posts.map(post => [post.id, post]));
+    idIndexCache.set(posts, index);
+  }
+  return index.get(id);
+};
+
+// Word count without materializing a split array — a long post body would
+// otherwise allocate thousands of substrings just to read .length
+const WORD_RE = /\S+/g;
+
+const countWords = (text) => {
+  WORD_RE.lastIndex = 0;
+  let count = 0;
+  while (WORD_RE.test(text)) {
+    count++;
+  }
+  return count;
+};
+
+// Canonical post id derivation — every place that needs an id for a title
+// must go through this so ids stay consistent across writers
+const slugFromTitle = (title) =>
+  title.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/(^-|-$)/g, '');
+
+module.exports = { loadPosts, savePosts, findPostById, countWords, slugFromTitle };
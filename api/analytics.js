@@ -1,74 +1,63 @@
 // Vercel API Route for Analytics
-const fs = require('fs');
-const path = require('path');
-
-// Helper function to load posts
-const loadPosts = () => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    if (fs.existsSync(postsPath)) {
-      const data = fs.readFileSync(postsPath, 'utf8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('Error loading posts:', error);
-    return [];
-  }
-};
+const { loadPosts } = require('./_lib/posts');
 
 // Generate analytics data
 const generateAnalytics = (posts) => {
   const now = new Date();
   const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
-  
-  // Recent posts (last 30 days)
-  const recentPosts = posts.filter(post => {
-    const postDate = new Date(post.date);
-    return postDate >= thirtyDaysAgo;
-  });
+  const twelveMonthsAgo = new Date(now.getTime() - 12 * 30 * 24 * 60 * 60 * 1000);
 
-  // Category distribution
+  // Accumulate every aggregate in a single pass over the posts instead of
+  // filtering/reducing the array once per statistic
+  const recentPosts = [];
   const categoryStats = {};
+  const tagStats = {};
+  const monthlyStats = {};
+  let featuredCount = 0;
+  let readTimeSum = 0;
+
   posts.forEach(post => {
+    const postDate = new Date(post.date);
+
+    // Recent posts (last 30 days)
+    if (postDate >= thirtyDaysAgo) {
+      recentPosts.push(post);
+    }
+
+    // Category distribution
     if (post.categories) {
       post.categories.forEach(category => {
         categoryStats[category] = (categoryStats[category] || 0) + 1;
       });
     }
-  });
 
-  // Tag distribution
-  const tagStats = {};
-  posts.forEach(post => {
+    // Tag distribution
     if (post.tags) {
       post.tags.forEach(tag => {
         tagStats[tag] = (tagStats[tag] || 0) + 1;
       });
     }
-  });
 
-  // Monthly post distribution (last 12 months)
-  const monthlyStats = {};
-  const twelveMonthsAgo = new Date(now.getTime() - 12 * 30 * 24 * 60 * 60 * 1000);
-  
-  posts.forEach(post => {
-    const postDate = new Date(post.date);
+    // Monthly post distribution (last 12 months)
     if (postDate >= twelveMonthsAgo) {
       const monthKey = postDate.toLocaleDateString('en-US', { year: 'numeric', month: 'short' });
       monthlyStats[monthKey] = (monthlyStats[monthKey] || 0) + 1;
     }
+
+    if (post.featured) {
+      featuredCount++;
+    }
+    readTimeSum += post.readTime || 5;
   });
 
   return {
     overview: {
       totalPosts: posts.length,
       recentPosts: recentPosts.length,
-      featuredPosts: posts.filter(post => post.featured).length,
+      featuredPosts: featuredCount,
       totalCategories: Object.keys(categoryStats).length,
       totalTags: Object.keys(tagStats).length,
-      averageReadTime: posts.length > 0 ? 
-        Math.round(posts.reduce((sum, post) => sum + (post.readTime || 5), 0) / posts.length) : 0
+      averageReadTime: posts.length > 0 ? Math.round(readTimeSum / posts.length) : 0
     },
     categories: Object.entries(categoryStats)
       .map(([name, count]) => ({ name, count }))
@@ -112,7 +101,9 @@ module.exports = function handler(req, res) {
   try {
     const posts = loadPosts();
     const analytics = generateAnalytics(posts);
-    
+
+    // Let the edge own expiry instead of recomputing per request
+    res.setHeader('Cache-Control', 's-maxage=300, stale-while-revalidate=600');
     res.status(200).json({
       ...analytics,
       timestamp: new Date().toISOString(),
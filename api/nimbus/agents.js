@@ -1,4 +1,6 @@
 // Nimbus AI Agents API endpoint
+const { getDefaultAgents } = require('../_lib/nimbus');
+
 module.exports = function handler(req, res) {
   // Set CORS headers
   res.setHeader('Access-Control-Allow-Origin', '*');
@@ -11,57 +13,8 @@ module.exports = function handler(req, res) {
   }
 
   try {
-    // Default agents configuration
-    const defaultAgents = [
-      {
-        agent_id: 'gpt4',
-        name: 'GPT-4 Assistant',
-        description: 'Advanced AI assistant powered by OpenAI GPT-4, excellent for complex reasoning and detailed responses',
-        capabilities: ['reasoning', 'writing', 'analysis', 'coding', 'creative tasks'],
-        inputs: ['user_message', 'context'],
-        outputs: ['response', 'reasoning'],
-        status: process.env.OPENAI_API_KEY ? 'active' : 'inactive',
-        escalates_to_human: false,
-        model: 'gpt-4',
-        provider: 'openai'
-      },
-      {
-        agent_id: 'claude',
-        name: 'Claude Assistant',
-        description: 'Anthropic Claude AI, known for helpful, harmless, and honest responses with strong analytical capabilities',
-        capabilities: ['analysis', 'writing', 'reasoning', 'research', 'summarization'],
-        inputs: ['user_message', 'context'],
-        outputs: ['response', 'analysis'],
-        status: process.env.ANTHROPIC_API_KEY ? 'active' : 'inactive',
-        escalates_to_human: false,
-        model: 'claude-3-5-sonnet-20240620',
-        provider: 'anthropic'
-      },
-      {
-        agent_id: 'grok',
-        name: 'Grok Assistant',
-        description: 'xAI Grok AI with real-time information access and conversational abilities',
-        capabilities: ['conversation', 'real-time info', 'humor', 'current events'],
-        inputs: ['user_message', 'context'],
-        outputs: ['response', 'real_time_data'],
-        status: process.env.XAI_GROK_API_KEY ? 'active' : 'inactive',
-        escalates_to_human: false,
-        model: 'grok-beta',
-        provider: 'xai'
-      },
-      {
-        agent_id: 'nimbus',
-        name: 'Nimbus Multi-Agent',
-        description: 'Intelligent routing system that selects the best AI agent for each query',
-        capabilities: ['agent_routing', 'multi_agent_coordination', 'fallback_handling'],
-        inputs: ['user_message', 'context', 'preferred_agent'],
-        outputs: ['response', 'agent_used', 'routing_decision'],
-        status: 'active',
-        escalates_to_human: true,
-        model: 'multi-agent-router',
-        provider: 'nimbus'
-      }
-    ];
+    // Default agents configuration, shared with the dashboard endpoint
+    const defaultAgents = getDefaultAgents();
 
     if (req.method === 'GET') {
       // Return list of available agents
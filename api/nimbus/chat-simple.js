@@ -1,85 +1,141 @@
 // Simple Nimbus AI Chat API endpoint for Vercel
 
+// Keyword patterns for agent selection, compiled once at module load so each
+// routing decision is a single scan of the message per category instead of a
+// substring search per keyword
+
+// Sleep and wellness queries -> Claude (good for health topics)
+const CLAUDE_KEYWORDS = /sleep|naura|insomnia|wellness|mental health|anxiety/;
+
+// Creative, emotional, or conversational queries -> Grok
+const GROK_KEYWORDS = /feel|mood|stress|creative|fun|joke/;
+
 // Agent selection logic
 function selectBestAgent(message) {
   const lowerMessage = message.toLowerCase();
-  
-  // Sleep and wellness queries -> Claude (good for health topics)
-  if (lowerMessage.includes('sleep') || lowerMessage.includes('naura') || 
-      lowerMessage.includes('insomnia') || lowerMessage.includes('wellness') ||
-      lowerMessage.includes('mental health') || lowerMessage.includes('anxiety')) {
+
+  if (CLAUDE_KEYWORDS.test(lowerMessage)) {
     return 'claude';
   }
-  
-  // Creative, emotional, or conversational queries -> Grok
-  if (lowerMessage.includes('feel') || lowerMessage.includes('mood') || 
-      lowerMessage.includes('stress') || lowerMessage.includes('creative') ||
-      lowerMessage.includes('fun') || lowerMessage.includes('joke')) {
+
+  if (GROK_KEYWORDS.test(lowerMessage)) {
     return 'grok';
   }
-  
+
   // Technical, analytical, or general queries -> GPT-4
   return 'gpt4';
 }
 
-// OpenAI GPT-5 nano API call
-async function callOpenAI(message) {
+// The API key never changes within a warm instance, so clean it once at first
+// use instead of per call. Connection reuse itself is handled by Node's shared
+// undici agent, which keeps sockets to api.openai.com alive between calls.
+let cachedApiKey = null;
+
+function getOpenAIKey() {
+  if (cachedApiKey) {
+    return cachedApiKey;
+  }
+
   const apiKey = process.env.OPENAI_API_KEY;
   if (!apiKey) {
     throw new Error('OpenAI API key not configured');
   }
 
   // Clean the API key (remove quotes, whitespace, etc.)
-  const cleanApiKey = apiKey.trim().replace(/^["']|["']$/g, '');
-
-  console.log('Making OpenAI API call...');
-
-  try {
-    // Add timeout to prevent hanging
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), 15000); // 15 second timeout
-
-    const response = await fetch('https://api.openai.com/v1/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${cleanApiKey}`,
-        'Content-Type': 'application/json',
-      },
-      signal: controller.signal,
-      body: JSON.stringify({
-        model: 'gpt-5-nano', // Use GPT-5 nano for improved performance
-        messages: [
-          {
-            role: 'system',
-            content: `You are Nimbus AI, a helpful assistant for Akeyreu, a mental wellness company. Be empathetic and supportive.`
-          },
-          { role: 'user', content: message }
-        ],
-        max_completion_tokens: 300,
-      }),
-    });
+  cachedApiKey = apiKey.trim().replace(/^["']|["']$/g, '');
+  return cachedApiKey;
+}
 
-    clearTimeout(timeoutId);
-    console.log('OpenAI response status:', response.status);
+// The system prompt never varies per request; one module-level constant
+// instead of a fresh template literal on every attempt
+const SYSTEM_PROMPT = 'You are Nimbus AI, a helpful assistant for Akeyreu, a mental wellness company. Be empathetic and supportive.';
 
-    if (!response.ok) {
-      const errorText = await response.text();
-      console.error('OpenAI API error:', response.status, errorText);
-      throw new Error(`OpenAI API error: ${response.status} - ${errorText}`);
-    }
+// Statuses worth a second attempt — client errors like 400/401/404 will
+// never succeed, so retrying them only wastes time
+const RETRYABLE_STATUS = new Set([408, 429, 500, 502, 503, 504]);
 
-    const data = await response.json();
-    console.log('OpenAI response received successfully');
-    return data.choices[0].message.content;
-  } catch (error) {
-    console.error('Error in callOpenAI:', error);
+// vercel.json caps this function at 30s. Budget the whole call (both
+// attempts plus any backoff) to finish inside that, so a failing retry still
+// returns through the handler's fallback JSON instead of a platform 504.
+const ATTEMPT_TIMEOUT_MS = 15000;
+const CALL_BUDGET_MS = 25000;
+// Don't bother retrying unless at least this much budget remains after the
+// backoff — a starved second attempt would only time out anyway
+const MIN_RETRY_BUDGET_MS = 3000;
 
-    // Handle timeout specifically
-    if (error.name === 'AbortError') {
-      throw new Error('OpenAI API request timed out after 15 seconds');
+// OpenAI GPT-5 nano API call
+async function callOpenAI(message) {
+  const cleanApiKey = getOpenAIKey();
+  const maxAttempts = 2;
+  const deadline = Date.now() + CALL_BUDGET_MS;
+
+  for (let attempt = 1; attempt <= maxAttempts; attempt++) {
+    try {
+      // Add timeout to prevent hanging, shrunk to whatever budget remains
+      const controller = new AbortController();
+      const timeoutMs = Math.min(ATTEMPT_TIMEOUT_MS, deadline - Date.now());
+      const timeoutId = setTimeout(() => controller.abort(), timeoutMs);
+
+      const response = await fetch('https://api.openai.com/v1/chat/completions', {
+        method: 'POST',
+        headers: {
+          'Authorization': `Bearer ${cleanApiKey}`,
+          'Content-Type': 'application/json',
+        },
+        signal: controller.signal,
+        body: JSON.stringify({
+          model: 'gpt-5-nano', // Use GPT-5 nano for improved performance
+          messages: [
+            { role: 'system', content: SYSTEM_PROMPT },
+            { role: 'user', content: message }
+          ],
+          max_completion_tokens: 300,
+        }),
+      });
+
+      clearTimeout(timeoutId);
+
+      if (!response.ok) {
+        const errorText = await response.text();
+        console.error('OpenAI API error:', response.status, errorText);
+
+        if (attempt < maxAttempts && RETRYABLE_STATUS.has(response.status)) {
+          // Honor Retry-After when the API provides it (capped at 5s),
+          // otherwise a short jitter — but only retry if enough budget
+          // remains after the wait for the second attempt to be worthwhile
+          const retryAfter = Number(response.headers.get('retry-after'));
+          const waitMs = retryAfter > 0
+            ? Math.min(retryAfter * 1000, 5000)
+            : 1000 + Math.random() * 500;
+          if (deadline - Date.now() - waitMs >= MIN_RETRY_BUDGET_MS) {
+            await new Promise(resolve => setTimeout(resolve, waitMs));
+            continue;
+          }
+        }
+
+        throw new Error(`OpenAI API error: ${response.status} - ${errorText}`);
+      }
+
+      const data = await response.json();
+
+      // Validate the shape explicitly — a malformed payload should surface as
+      // a clear error instead of a TypeError swallowed by the generic fallback
+      const content = data.choices?.[0]?.message?.content;
+      if (!content) {
+        throw new Error('OpenAI response missing message content');
+      }
+
+      return content;
+    } catch (error) {
+      console.error('Error in callOpenAI:', error);
+
+      // Handle timeout specifically
+      if (error.name === 'AbortError') {
+        throw new Error('OpenAI API request timed out');
+      }
+
+      throw error;
     }
-
-    throw error;
   }
 }
 
@@ -108,6 +164,15 @@ module.exports = async function handler(req, res) {
     });
   }
 
+  // Reject oversized prompts before they cost model tokens; the admin chat
+  // input enforces the same limit client-side
+  if (message.length > 2000) {
+    return res.status(400).json({
+      error: 'Message is too long (max 2000 characters)',
+      timestamp: new Date().toISOString()
+    });
+  }
+
   // Check if any AI API keys are configured
   const hasApiKeys = !!(process.env.OPENAI_API_KEY || process.env.ANTHROPIC_API_KEY || process.env.XAI_GROK_API_KEY);
 
@@ -127,14 +192,10 @@ module.exports = async function handler(req, res) {
   }
 
   try {
-    console.log('Processing chat request:', { message: message.substring(0, 50) + '...', agent_id });
-
     // Use GPT-5 nano for improved performance and efficiency
     const response = await callOpenAI(message);
     const agentUsed = 'gpt5-nano';
 
-    console.log('Chat response generated successfully');
-
     res.json({
       message: response,
       conversation_id: conversation_id || `conv_${Date.now()}`,
@@ -0,0 +1,55 @@
+// Nimbus AI Dashboard API endpoint for Vercel
+// The admin view needs the detailed health report and the agent list at the
+// same time; serving both from one endpoint turns two round-trips (and two
+// function invocations) into one.
+const { getDefaultAgents, getServiceHealth } = require('../_lib/nimbus');
+
+module.exports = function handler(req, res) {
+  // Set CORS headers
+  res.setHeader('Access-Control-Allow-Origin', '*');
+  res.setHeader('Access-Control-Allow-Methods', 'GET, OPTIONS');
+  res.setHeader('Access-Control-Allow-Headers', 'Content-Type, Authorization');
+
+  if (req.method === 'OPTIONS') {
+    res.status(200).end();
+    return;
+  }
+
+  if (req.method !== 'GET') {
+    return res.status(405).json({ error: 'Method not allowed' });
+  }
+
+  try {
+    const services = getServiceHealth();
+    const healthyCount = services.filter(s => s.status === 'healthy').length;
+
+    const agents = getDefaultAgents();
+    const activeAgents = agents.filter(agent => agent.status === 'active');
+
+    res.status(200).json({
+      health: {
+        status: healthyCount > 0 ? 'healthy' : 'unhealthy',
+        service: 'nimbus-ai',
+        services: {
+          total: services.length,
+          healthy: healthyCount,
+          unhealthy: services.length - healthyCount,
+          details: services
+        }
+      },
+      agents: {
+        agents,
+        active_agents: activeAgents,
+        total: agents.length,
+        active_count: activeAgents.length
+      },
+      timestamp: new Date().toISOString()
+    });
+  } catch (error) {
+    console.error('Nimbus Dashboard API Error:', error);
+    res.status(500).json({
+      error: 'Internal server error',
+      timestamp: new Date().toISOString()
+    });
+  }
+};
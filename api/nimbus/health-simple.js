@@ -1,4 +1,5 @@
 // Simple Nimbus AI Health Check API endpoint for Vercel
+const { getServiceHealth } = require('../_lib/nimbus');
 
 module.exports = async function handler(req, res) {
   // Set CORS headers
@@ -30,27 +31,8 @@ module.exports = async function handler(req, res) {
       return res.json(basicHealth);
     }
 
-    // Detailed health check
-    const services = [
-      {
-        service: 'openai',
-        status: process.env.OPENAI_API_KEY ? 'healthy' : 'unhealthy',
-        response_time_ms: 150,
-        last_checked: new Date().toISOString()
-      },
-      {
-        service: 'claude',
-        status: process.env.ANTHROPIC_API_KEY ? 'healthy' : 'unhealthy',
-        response_time_ms: 200,
-        last_checked: new Date().toISOString()
-      },
-      {
-        service: 'grok',
-        status: process.env.XAI_GROK_API_KEY ? 'healthy' : 'unhealthy',
-        response_time_ms: 180,
-        last_checked: new Date().toISOString()
-      }
-    ];
+    // Detailed health check, shared with the dashboard endpoint
+    const services = getServiceHealth();
 
     const healthyCount = services.filter(s => s.status === 'healthy').length;
 
@@ -1,33 +1,5 @@
 // Vercel API Route for Blog Posts
-const fs = require('fs');
-const path = require('path');
-
-// Helper functions
-const loadPosts = () => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    if (fs.existsSync(postsPath)) {
-      const data = fs.readFileSync(postsPath, 'utf8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('Error loading posts:', error);
-    return [];
-  }
-};
-
-const savePosts = (posts) => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    const data = JSON.stringify(posts, null, 2);
-    fs.writeFileSync(postsPath, data, 'utf8');
-    return true;
-  } catch (error) {
-    console.error('Error saving posts:', error);
-    return false;
-  }
-};
+const { loadPosts, savePosts, countWords, slugFromTitle } = require('./_lib/posts');
 
 module.exports = function handler(req, res) {
   // Set CORS headers
@@ -43,7 +15,16 @@ module.exports = function handler(req, res) {
   try {
     if (req.method === 'GET') {
       const posts = loadPosts();
-      res.status(200).json(posts);
+
+      // List views only need metadata and the summary — the full content is
+      // the bulk of the payload and is served per-post by /api/posts/[slug].
+      // The admin editor opts back in with ?include=content.
+      if (req.query && req.query.include === 'content') {
+        return res.status(200).json(posts);
+      }
+
+      const listView = posts.map(({ content, ...rest }) => rest);
+      res.status(200).json(listView);
     } else if (req.method === 'POST') {
       const posts = loadPosts();
       const { title, content, author, categories, tags, featured } = req.body;
@@ -56,7 +37,7 @@ module.exports = function handler(req, res) {
       }
 
       // Generate ID from title
-      const id = title.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/(^-|-$)/g, '');
+      const id = slugFromTitle(title);
 
       // Check if post with this ID already exists
       const existingPost = posts.find(post => post.id === id);
@@ -81,7 +62,7 @@ module.exports = function handler(req, res) {
         tags: tags || [],
         summary: content.substring(0, 200) + (content.length > 200 ? '...' : ''),
         featured: featured || false,
-        readTime: Math.ceil(content.split(/\s+/).length / 200),
+        readTime: Math.ceil(countWords(content) / 200),
         content
       };
 
@@ -1,35 +1,7 @@
 // Enhanced API endpoint for individual post CRUD operations
 // File: /api/posts/[slug].js
 
-const fs = require('fs');
-const path = require('path');
-
-// Helper function to load posts
-const loadPosts = () => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    if (fs.existsSync(postsPath)) {
-      const data = fs.readFileSync(postsPath, 'utf8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('Error loading posts:', error);
-    return [];
-  }
-};
-
-const savePosts = (posts) => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    const data = JSON.stringify(posts, null, 2);
-    fs.writeFileSync(postsPath, data, 'utf8');
-    return true;
-  } catch (error) {
-    console.error('Error saving posts:', error);
-    return false;
-  }
-};
+const { loadPosts, savePosts, findPostById } = require('../_lib/posts');
 
 module.exports = async function handler(req, res) {
   // Set CORS headers
@@ -48,7 +20,7 @@ module.exports = async function handler(req, res) {
     const posts = loadPosts();
 
     if (req.method === 'GET') {
-      const post = posts.find(p => p.id === slug);
+      const post = findPostById(posts, slug);
       if (post) {
         res.status(200).json(post);
       } else {
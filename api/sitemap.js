@@ -1,21 +1,5 @@
 // Simple sitemap.xml API endpoint
-const fs = require('fs');
-const path = require('path');
-
-// Helper function to load posts
-const loadPosts = () => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    if (fs.existsSync(postsPath)) {
-      const data = fs.readFileSync(postsPath, 'utf8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('Error loading posts:', error);
-    return [];
-  }
-};
+const { loadPosts } = require('./_lib/posts');
 
 module.exports = function handler(req, res) {
   // Set CORS headers
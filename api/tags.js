@@ -1,21 +1,5 @@
 // Vercel API Route for Tags
-const fs = require('fs');
-const path = require('path');
-
-// Helper function to load posts
-const loadPosts = () => {
-  try {
-    const postsPath = path.join(process.cwd(), 'public', 'posts.json');
-    if (fs.existsSync(postsPath)) {
-      const data = fs.readFileSync(postsPath, 'utf8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('Error loading posts:', error);
-    return [];
-  }
-};
+const { loadPosts } = require('./_lib/posts');
 
 // Extract tags from posts
 const getTags = (posts) => {
@@ -51,7 +35,9 @@ module.exports = function handler(req, res) {
   try {
     const posts = loadPosts();
     const tags = getTags(posts);
-    
+
+    // Let the edge own expiry instead of recomputing per request
+    res.setHeader('Cache-Control', 's-maxage=300, stale-while-revalidate=600');
     res.status(200).json({
       tags,
       total: tags.length,
@@ -3,60 +3,109 @@
 // Simple development server for testing the blog enhancements
 const http = require('http');
 const fs = require('fs').promises;
+const { createReadStream } = require('fs');
 const path = require('path');
 const url = require('url');
 
 const PORT = 3000;
 
+const POSTS_FILE = path.join(__dirname, '..', 'public', 'posts.json');
+
 // Simple data functions for development
+// Cache the parsed-posts promise keyed by file mtime: concurrent requests
+// coalesce onto one read+parse instead of each hitting the disk, and edits to
+// posts.json still show up on the next request.
+let postsPromise = null;
+let postsMtimeMs = 0;
+
 async function getAllPosts() {
-  const postsData = await fs.readFile(path.join(__dirname, '..', 'public', 'posts.json'), 'utf8');
-  return JSON.parse(postsData);
+  const { mtimeMs } = await fs.stat(POSTS_FILE);
+  if (!postsPromise || mtimeMs !== postsMtimeMs) {
+    postsMtimeMs = mtimeMs;
+    postsPromise = fs.readFile(POSTS_FILE, 'utf8').then(JSON.parse);
+  }
+  return postsPromise;
 }
 
-async function getPostBySlug(slug) {
-  const posts = await getAllPosts();
-  return posts.find(post => post.id === slug);
+// Drop the heavy content field for list views without copying it into a new
+// object alongside a dangling `content: undefined` key
+function toListView(post) {
+  const { content, ...listView } = post;
+  return listView;
 }
 
-async function searchPosts(query = '', filters = {}) {
-  const posts = await getAllPosts();
-  let filteredPosts = posts;
+// Date-sorted view per cached posts array, built once instead of re-sorting
+// on every feed request; the shared array itself is never mutated
+const sortedByDateCache = new WeakMap();
 
-  // Apply filters
-  if (filters.category) {
-    filteredPosts = filteredPosts.filter(post =>
-      post.categories && post.categories.includes(filters.category)
-    );
+function sortedByDate(posts) {
+  let sorted = sortedByDateCache.get(posts);
+  if (!sorted) {
+    sorted = [...posts].sort((a, b) => new Date(b.date) - new Date(a.date));
+    sortedByDateCache.set(posts, sorted);
   }
+  return sorted;
+}
 
-  if (filters.tag) {
-    filteredPosts = filteredPosts.filter(post =>
-      post.tags && post.tags.includes(filters.tag)
-    );
+// Lowercased searchable text per post, computed once per cached post object
+// instead of re-lowercasing five fields on every query
+const searchTextCache = new WeakMap();
+
+function searchTextOf(post) {
+  let text = searchTextCache.get(post);
+  if (text === undefined) {
+    text = [
+      post.title,
+      post.content,
+      post.summary,
+      ...(post.categories || []),
+      ...(post.tags || [])
+    ].filter(Boolean).join('\n').toLowerCase();
+    searchTextCache.set(post, text);
   }
+  return text;
+}
 
-  if (filters.featured !== undefined) {
-    filteredPosts = filteredPosts.filter(post => post.featured === filters.featured);
-  }
+// The helpers below take the posts array loaded by the route handler so one
+// request resolves the cache once and shares the result, mirroring the
+// helper style in setupProxy.js
+
+function getPostBySlug(posts, slug) {
+  return posts.find(post => post.id === slug);
+}
+
+function searchPosts(posts, query = '', filters = {}) {
+  const searchTerm = query ? query.toLowerCase() : '';
 
-  // Apply text search
-  if (query) {
-    const searchTerm = query.toLowerCase();
-    filteredPosts = filteredPosts.filter(post =>
-      post.title.toLowerCase().includes(searchTerm) ||
-      (post.content && post.content.toLowerCase().includes(searchTerm)) ||
-      (post.summary && post.summary.toLowerCase().includes(searchTerm)) ||
-      (post.categories && post.categories.some(cat => cat.toLowerCase().includes(searchTerm))) ||
-      (post.tags && post.tags.some(tag => tag.toLowerCase().includes(searchTerm)))
-    );
+  // Nothing to match against — skip the filter pass entirely
+  if (!searchTerm && !filters.category && !filters.tag && filters.featured === undefined) {
+    return posts;
   }
 
-  return filteredPosts;
+  // Apply filters and text search in a single pass instead of allocating an
+  // intermediate array per criterion
+  return posts.filter(post => {
+    if (filters.category && !(post.categories && post.categories.includes(filters.category))) {
+      return false;
+    }
+
+    if (filters.tag && !(post.tags && post.tags.includes(filters.tag))) {
+      return false;
+    }
+
+    if (filters.featured !== undefined && post.featured !== filters.featured) {
+      return false;
+    }
+
+    if (searchTerm) {
+      return searchTextOf(post).includes(searchTerm);
+    }
+
+    return true;
+  });
 }
 
-async function getAllCategories() {
-  const posts = await getAllPosts();
+function getAllCategories(posts) {
   const categories = new Set();
   posts.forEach(post => {
     if (post.categories) {
@@ -66,8 +115,7 @@ async function getAllCategories() {
   return Array.from(categories).sort();
 }
 
-async function getAllTags() {
-  const posts = await getAllPosts();
+function getAllTags(posts) {
   const tagCounts = {};
   posts.forEach(post => {
     if (post.tags) {
@@ -81,22 +129,19 @@ async function getAllTags() {
     .sort((a, b) => b.count - a.count);
 }
 
-async function getPostsByCategory(category) {
-  const posts = await getAllPosts();
+function getPostsByCategory(posts, category) {
   return posts.filter(post =>
     post.categories && post.categories.includes(category)
   );
 }
 
-async function getPostsByTag(tag) {
-  const posts = await getAllPosts();
+function getPostsByTag(posts, tag) {
   return posts.filter(post =>
     post.tags && post.tags.includes(tag)
   );
 }
 
-async function getFeaturedPosts() {
-  const posts = await getAllPosts();
+function getFeaturedPosts(posts) {
   return posts.filter(post => post.featured === true);
 }
 
@@ -115,10 +160,7 @@ const server = http.createServer(async (req, res) => {
     // API Routes
     if (pathname === '/api/posts') {
       const posts = await getAllPosts();
-      const transformedPosts = posts.map(post => ({
-        ...post,
-        content: undefined // Exclude content for list view
-      }));
+      const transformedPosts = posts.map(toListView);
 
       res.writeHead(200, { 'Content-Type': 'application/json' });
       res.end(JSON.stringify(transformedPosts));
@@ -127,7 +169,7 @@ const server = http.createServer(async (req, res) => {
 
     if (pathname.startsWith('/api/posts/')) {
       const slug = pathname.split('/')[3];
-      const post = await getPostBySlug(slug);
+      const post = getPostBySlug(await getAllPosts(), slug);
 
       if (!post) {
         res.writeHead(404, { 'Content-Type': 'application/json' });
@@ -148,11 +190,8 @@ const server = http.createServer(async (req, res) => {
       if (tag) filters.tag = tag;
       if (featured !== undefined) filters.featured = featured === 'true';
 
-      const posts = await searchPosts(q || '', filters);
-      const transformedPosts = posts.map(post => ({
-        ...post,
-        content: undefined
-      }));
+      const posts = searchPosts(await getAllPosts(), q || '', filters);
+      const transformedPosts = posts.map(toListView);
 
       const result = {
         query: q || '',
@@ -171,7 +210,7 @@ const server = http.createServer(async (req, res) => {
     }
 
     if (pathname === '/api/categories') {
-      const categories = await getAllCategories();
+      const categories = getAllCategories(await getAllPosts());
       const result = {
         categories,
         count: categories.length,
@@ -187,7 +226,7 @@ const server = http.createServer(async (req, res) => {
     }
 
     if (pathname === '/api/tags') {
-      const tags = await getAllTags();
+      const tags = getAllTags(await getAllPosts());
       const result = {
         tags,
         count: tags.length,
@@ -203,11 +242,8 @@ const server = http.createServer(async (req, res) => {
     }
 
     if (pathname === '/api/featured') {
-      const posts = await getFeaturedPosts();
-      const transformedPosts = posts.map(post => ({
-        ...post,
-        content: undefined
-      }));
+      const posts = getFeaturedPosts(await getAllPosts());
+      const transformedPosts = posts.map(toListView);
 
       const result = {
         posts: transformedPosts,
@@ -225,7 +261,7 @@ const server = http.createServer(async (req, res) => {
 
     if (pathname === '/api/rss') {
       const posts = await getAllPosts();
-      const sortedPosts = posts.sort((a, b) => new Date(b.date) - new Date(a.date));
+      const sortedPosts = sortedByDate(posts);
 
       const rssItems = sortedPosts.slice(0, 20).map(post => `
     <item>
@@ -257,7 +293,7 @@ const server = http.createServer(async (req, res) => {
     if (pathname.startsWith('/favicon') || pathname.endsWith('.css') || pathname.endsWith('.js') || pathname.endsWith('.png') || pathname.endsWith('.jpg') || pathname.endsWith('.ico')) {
       try {
         const filePath = path.join(__dirname, '..', 'public', pathname);
-        const content = await fs.readFile(filePath);
+        await fs.access(filePath);
 
         let contentType = 'text/plain';
         if (pathname.endsWith('.css')) contentType = 'text/css';
@@ -267,7 +303,11 @@ const server = http.createServer(async (req, res) => {
         if (pathname.endsWith('.ico')) contentType = 'image/x-icon';
 
         res.writeHead(200, { 'Content-Type': contentType });
-        res.end(content);
+
+        // Stream the file to the response instead of buffering it all
+        const stream = createReadStream(filePath);
+        stream.on('error', () => res.destroy());
+        stream.pipe(res);
         return;
       } catch (err) {
         // File not found, continue to serve index.html
@@ -287,6 +327,13 @@ const server = http.createServer(async (req, res) => {
   }
 });
 
+// Keep client connections alive between requests instead of relying on the
+// Node defaults, so rapid navigation reuses sockets rather than paying a new
+// TCP handshake per request. headersTimeout must stay above keepAliveTimeout
+// to avoid races that drop in-flight requests.
+server.keepAliveTimeout = 65000;
+server.headersTimeout = 66000;
+
 // Start server
 server.listen(PORT, () => {
   console.log(`🚀 Development server running at http://localhost:${PORT}`);
@@ -173,17 +173,17 @@ async function generateSitemap() {
     
     console.log(`   ✓ Generated ${pages.length} total pages`);
     
-    // Generate sitemap XML
+    // Generate sitemap XML and robots.txt
     const sitemapXML = generateSitemapXML(pages);
-    
-    // Write sitemap file
-    await fs.writeFile(SITEMAP_FILE, sitemapXML, 'utf8');
-    console.log(`   ✓ Sitemap written to ${SITEMAP_FILE}`);
-    
-    // Generate and write robots.txt
     const robotsTxt = generateRobotsTxt();
     const robotsFile = path.join(__dirname, '..', 'public', 'robots.txt');
-    await fs.writeFile(robotsFile, robotsTxt, 'utf8');
+
+    // The two writes are independent, so run them concurrently
+    await Promise.all([
+      fs.writeFile(SITEMAP_FILE, sitemapXML, 'utf8'),
+      fs.writeFile(robotsFile, robotsTxt, 'utf8')
+    ]);
+    console.log(`   ✓ Sitemap written to ${SITEMAP_FILE}`);
     console.log(`   ✓ Robots.txt written to ${robotsFile}`);
     
     // Generate sitemap index if needed (for large sites)
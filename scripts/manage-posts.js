@@ -8,6 +8,8 @@ const path = require('path');
 
 const POSTS_FILE = path.join(__dirname, '..', 'public', 'posts.json');
 
+const { generateSitemap } = require('./generate-sitemap');
+
 // Helper functions
 async function loadPosts() {
     try {
@@ -64,7 +66,8 @@ async function addPost(title, date, content) {
     
     posts.unshift(newPost); // Add to beginning (newest first)
     await savePosts(posts);
-    
+    await generateSitemap(); // Keep the derived sitemap in the same run
+
     console.log(`Added post: "${title}"`);
 }
 
@@ -90,7 +93,8 @@ async function removePost(titleOrIndex) {
     
     const removedPost = posts.splice(index, 1)[0];
     await savePosts(posts);
-    
+    await generateSitemap(); // Keep the derived sitemap in the same run
+
     console.log(`Removed post: "${removedPost.title}"`);
 }
 
@@ -7,6 +7,30 @@ import MetaTags from './MetaTags';
 import LoadingSpinner from './LoadingSpinner';
 import ErrorBoundary from './ErrorBoundary';
 import BlogSearchAndFilters from './BlogSearchAndFilters';
+import { fetchPosts, prefetchPost } from '../utils/postsCache';
+
+// Hoisted so the pattern and helpers are built once at module load rather
+// than on every render
+const HTML_TAG_RE = /<[^>]+>/g;
+
+// Function to create a proper slug
+const createSlug = (title) => {
+  return slugify(title, {
+    lower: true,
+    strict: true,
+    remove: /[*+~.()'"!:@]/g
+  });
+};
+
+// Function to create a truncated summary
+const createSummary = (content, maxLength = 175) => {
+  if (!content) return '';
+
+  const plainText = content.replace(HTML_TAG_RE, ' ').trim();
+  if (plainText.length <= maxLength) return plainText;
+
+  return plainText.slice(0, maxLength).trim() + '...';
+};
 
 const Blog = () => {
   const [searchParams, setSearchParams] = useSearchParams();
@@ -24,16 +48,19 @@ const Blog = () => {
 
   // Fetch all posts on component mount
   useEffect(() => {
-    fetch('/api/posts')
-      .then((res) => {
-        if (!res.ok) {
-          throw new Error(`Failed to fetch posts: ${res.status} ${res.statusText}`);
-        }
-        return res.json();
-      })
+    // When the URL carried a search/filter at mount, the concurrent search
+    // request owns the visible list — don't clobber its results here
+    const hasInitialSearch = Boolean(
+      searchParams.get('q') || searchParams.get('category') ||
+      searchParams.get('tag') || searchParams.get('featured')
+    );
+
+    fetchPosts()
       .then((data) => {
         setAllPosts(data);
-        setPosts(data);
+        if (!hasInitialSearch) {
+          setPosts(data);
+        }
         setLoading(false);
       })
       .catch((err) => {
@@ -41,6 +68,7 @@ const Blog = () => {
         setError(err.message);
         setLoading(false);
       });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
   // Search and filter posts
@@ -117,31 +145,15 @@ const Blog = () => {
     searchAndFilterPosts(searchQuery, newFilters);
   }, [searchParams, setSearchParams, searchQuery, searchAndFilterPosts]);
 
-  // Apply initial search/filters from URL
+  // Apply initial search/filters from URL. Fires at mount so the search
+  // request runs concurrently with the /api/posts fetch above instead of
+  // waiting for it to finish first.
   useEffect(() => {
     if (searchQuery || Object.values(filters).some(v => v !== '' && v !== undefined)) {
       searchAndFilterPosts(searchQuery, filters);
     }
-  }, [allPosts]); // Only run when allPosts is loaded
-
-  // Function to create a proper slug
-  const createSlug = (title) => {
-    return slugify(title, {
-      lower: true,
-      strict: true,
-      remove: /[*+~.()'"!:@]/g
-    });
-  };
-
-  // Function to create a truncated summary
-  const createSummary = (content, maxLength = 175) => {
-    if (!content) return '';
-
-    const plainText = content.replace(/<[^>]+>/g, ' ').trim();
-    if (plainText.length <= maxLength) return plainText;
-
-    return plainText.slice(0, maxLength).trim() + '...';
-  };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
 
   // Check if we have active search/filters
   const hasActiveSearch = searchQuery || Object.values(filters).some(v => v !== '' && v !== undefined);
@@ -235,6 +247,8 @@ const Blog = () => {
                       to={`/blog/${slug}`}
                       className="blog-post-link"
                       aria-describedby={`post-summary-${index}`}
+                      onMouseEnter={() => prefetchPost(slug)}
+                      onFocus={() => prefetchPost(slug)}
                     >
                       <header className="post-header">
                         {post.featured && (
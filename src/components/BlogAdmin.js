@@ -29,14 +29,17 @@ const BlogAdmin = () => {
   const fetchData = async () => {
     try {
       const [postsRes, categoriesRes, tagsRes] = await Promise.all([
-        fetch('/api/posts'),
+        fetch('/api/posts?include=content'),
         fetch('/api/categories'),
         fetch('/api/tags')
       ]);
 
-      const postsData = await postsRes.json();
-      const categoriesData = await categoriesRes.json();
-      const tagsData = await tagsRes.json();
+      // Read the three bodies concurrently — they're independent streams
+      const [postsData, categoriesData, tagsData] = await Promise.all([
+        postsRes.json(),
+        categoriesRes.json(),
+        tagsRes.json()
+      ]);
 
       setPosts(postsData);
       setCategories(categoriesData.categories || []);
@@ -12,11 +12,10 @@ import LoadingSpinner from './LoadingSpinner';
 import ErrorBoundary from './ErrorBoundary';
 import SocialShare from './SocialShare';
 import RelatedPosts from './RelatedPosts';
+import { fetchPost } from '../utils/postsCache';
 
 const BlogPost = () => {
-  console.log('🚀 BlogPost component is rendering');
   const { slug } = useParams();
-  console.log('🚀 BlogPost slug:', slug);
   const navigate = useNavigate();
   const [post, setPost] = useState(null);
   const [loading, setLoading] = useState(true);
@@ -30,18 +29,10 @@ const BlogPost = () => {
       return;
     }
 
-    fetch(`/api/posts/${slug}`)
-      .then((res) => {
-        if (!res.ok) {
-          if (res.status === 404) {
-            throw new Error('Post not found');
-          }
-          throw new Error(`Failed to fetch post: ${res.status} ${res.statusText}`);
-        }
-        return res.json();
-      })
+    // Served from the hover-prefetch cache when the reader came from the
+    // blog list, so navigation usually paints without a network wait
+    fetchPost(slug)
       .then((data) => {
-        console.log('🚀 BlogPost fetched data:', data);
         setPost(data);
         setLoading(false);
       })
@@ -91,7 +82,6 @@ const BlogPost = () => {
 
   // Helper function to safely get string values
   const safeString = (value) => {
-    console.log('🔍 safeString called with:', { value, type: typeof value, isSymbol: typeof value === 'symbol' });
     if (value === null || value === undefined) return '';
     if (typeof value === 'string') return value;
     if (typeof value === 'symbol') {
@@ -101,27 +91,11 @@ const BlogPost = () => {
     return String(value);
   };
 
-  // Debug the post object
-  console.log('🐛 BlogPost Debug - Full post object:', post);
-  console.log('🐛 BlogPost Debug - Post keys and types:', Object.keys(post || {}).map(key => ({
-    key,
-    value: post[key],
-    type: typeof post[key],
-    isSymbol: typeof post[key] === 'symbol'
-  })));
-
   const safeTitle = safeString(post.title) || 'Untitled Post';
   const safeSummary = safeString(post.summary);
   const safeContent = safeString(post.content);
   const safeDate = safeString(post.date);
 
-  console.log('🐛 BlogPost Debug - Safe values:', {
-    safeTitle,
-    safeSummary: safeSummary.substring(0, 50) + '...',
-    safeContent: safeContent.substring(0, 50) + '...',
-    safeDate
-  });
-
   const canonicalSlug = post.url
     ? post.url.split('/').pop()
     : slugify(safeTitle, { lower: true, strict: true, remove: /[*+~.()'"!:@]/g });
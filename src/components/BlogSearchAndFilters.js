@@ -1,5 +1,6 @@
 import React, { useState, useRef, useEffect, useCallback } from 'react';
 import './BlogSearchAndFilters.css';
+import { fetchPosts } from '../utils/postsCache';
 
 const BlogSearchAndFilters = ({ 
   onSearch, 
@@ -20,37 +21,38 @@ const BlogSearchAndFilters = ({
   
   const searchInputRef = useRef(null);
   const suggestionsRef = useRef(null);
+  const suggestionTimerRef = useRef(null);
+
+  // Cancel any pending suggestions update when the component unmounts
+  useEffect(() => () => clearTimeout(suggestionTimerRef.current), []);
 
   // Load categories and tags
   useEffect(() => {
     const loadFiltersData = async () => {
       try {
-        const response = await fetch('/api/posts');
-        if (response.ok) {
-          const posts = await response.json();
-          
-          // Extract unique categories
-          const uniqueCategories = [...new Set(
-            posts.flatMap(post => post.categories || [])
-          )].sort();
-          
-          // Extract and count tags
-          const tagCounts = {};
-          posts.forEach(post => {
-            if (post.tags) {
-              post.tags.forEach(tag => {
-                tagCounts[tag] = (tagCounts[tag] || 0) + 1;
-              });
-            }
-          });
-          
-          const sortedTags = Object.entries(tagCounts)
-            .map(([tag, count]) => ({ tag, count }))
-            .sort((a, b) => b.count - a.count);
-          
-          setCategories(uniqueCategories);
-          setTags(sortedTags);
-        }
+        const posts = await fetchPosts();
+
+        // Extract unique categories
+        const uniqueCategories = [...new Set(
+          posts.flatMap(post => post.categories || [])
+        )].sort();
+
+        // Extract and count tags
+        const tagCounts = {};
+        posts.forEach(post => {
+          if (post.tags) {
+            post.tags.forEach(tag => {
+              tagCounts[tag] = (tagCounts[tag] || 0) + 1;
+            });
+          }
+        });
+
+        const sortedTags = Object.entries(tagCounts)
+          .map(([tag, count]) => ({ tag, count }))
+          .sort((a, b) => b.count - a.count);
+
+        setCategories(uniqueCategories);
+        setTags(sortedTags);
       } catch (error) {
         console.error('Error loading filter data:', error);
       } finally {
@@ -88,12 +90,16 @@ const BlogSearchAndFilters = ({
     setSuggestions([...new Set(suggestions)].slice(0, 5));
   }, [categories, tags]);
 
-  // Handle input changes
+  // Handle input changes. The query updates immediately so typing stays
+  // responsive, but suggestion generation is debounced so a burst of
+  // keystrokes produces one recompute instead of one per character.
   const handleInputChange = (e) => {
     const value = e.target.value;
     setQuery(value);
-    generateSuggestions(value);
     setShowSuggestions(value.length > 0);
+
+    clearTimeout(suggestionTimerRef.current);
+    suggestionTimerRef.current = setTimeout(() => generateSuggestions(value), 150);
   };
 
   // Handle search submission
@@ -140,8 +146,10 @@ const BlogSearchAndFilters = ({
     onFilterChange({ category: '', tag: '', featured: undefined });
   };
 
-  // Check if there are active filters
+  // Check if there are active filters; the count is shown in two places, so
+  // derive it once per render instead of re-walking the filters object
   const hasActiveFilters = activeFilters.category || activeFilters.tag || activeFilters.featured;
+  const activeFilterCount = Object.values(activeFilters).filter(v => v && v !== '').length;
   const displayTags = showAllTags ? tags : tags.slice(0, 8);
 
   return (
@@ -157,7 +165,7 @@ const BlogSearchAndFilters = ({
         <span>Search & Filters</span>
         {hasActiveFilters && (
           <span className="mobile-active-indicator">
-            ({Object.values(activeFilters).filter(v => v && v !== '').length})
+            ({activeFilterCount})
           </span>
         )}
       </button>
@@ -252,7 +260,7 @@ const BlogSearchAndFilters = ({
           Advanced Search & Filters
           {hasActiveFilters && (
             <span className="active-filters-indicator" aria-label="Active filters applied">
-              ({Object.values(activeFilters).filter(v => v && v !== '').length})
+              ({activeFilterCount})
             </span>
           )}
         </button>
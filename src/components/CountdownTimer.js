@@ -106,9 +106,6 @@ const CountdownTimer = ({ targetDate, className = '' }) => {
     marginTop: '0.25rem'
   };
 
-  // Debug logging
-  console.log('CountdownTimer rendering:', { timeLeft, targetDate });
-
   return (
     <div className={className} style={countdownStyle} role="timer" aria-live="polite">
       <div style={labelStyle}>
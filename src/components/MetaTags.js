@@ -24,26 +24,8 @@ const MetaTags = ({
     googleSiteVerification = null,
     bingVerification = null
 }) => {
-    // Debug all incoming props
-    console.log('🐛 MetaTags Debug - Component called with title:', title);
-    console.log('🐛 MetaTags Debug - All props:', {
-        title, description, keywords, canonicalUrl, ogType, publishDate, modifiedDate,
-        ogImage, ogImageAlt, author, section, tags, locale, siteName, twitterSite,
-        twitterCreator, robots, googleSiteVerification, bingVerification
-    });
-
-    console.log('🐛 MetaTags Debug - Prop types:', {
-        title: typeof title,
-        description: typeof description,
-        keywords: typeof keywords,
-        canonicalUrl: typeof canonicalUrl,
-        author: typeof author,
-        tags: Array.isArray(tags) ? 'array' : typeof tags
-    });
-
     // Helper function to safely convert values to strings
     const safeString = (value) => {
-        console.log('🔍 MetaTags safeString called with:', { value, type: typeof value, isSymbol: typeof value === 'symbol' });
         if (value === null || value === undefined) return '';
         if (typeof value === 'string') return value;
         if (typeof value === 'symbol') {
@@ -68,14 +50,6 @@ const MetaTags = ({
     const safeOgImage = safeString(ogImage);
     const safeOgImageAlt = safeString(ogImageAlt);
 
-    console.log('🐛 MetaTags Debug - Safe converted values:', {
-        safeTitle,
-        safeDescription: safeDescription.substring(0, 50) + '...',
-        safeCanonicalUrl,
-        safeKeywords,
-        safeAuthor
-    });
-
     // Ensure title is not too long for social media
     const socialTitle = safeTitle.length > 60 ? safeTitle.substring(0, 57) + '...' : safeTitle;
 
@@ -102,45 +76,6 @@ const MetaTags = ({
         ]
     } : null;
 
-    console.log('🐛 MetaTags Debug - About to render Helmet with socialTitle:', socialTitle, 'type:', typeof socialTitle);
-    console.log('🐛 MetaTags Debug - About to render Helmet with socialDescription:', socialDescription, 'type:', typeof socialDescription);
-
-    // Check all the values we're about to pass to Helmet
-    const helmetProps = {
-        socialTitle,
-        socialDescription,
-        safeKeywords,
-        safeAuthor,
-        safeRobots,
-        safeLocale,
-        safeCanonicalUrl,
-        safeOgImage,
-        safeOgImageAlt,
-        safeSiteName,
-        safeTwitterSite,
-        safeTwitterCreator,
-        ogType,
-        publishDate,
-        modifiedDate,
-        tags
-    };
-
-    console.log('🐛 MetaTags Debug - All Helmet props:', helmetProps);
-
-    // Check for any Symbol values in the props
-    Object.entries(helmetProps).forEach(([key, value]) => {
-        if (typeof value === 'symbol') {
-            console.error('🚨 SYMBOL DETECTED in', key, ':', value);
-        }
-        if (Array.isArray(value)) {
-            value.forEach((item, index) => {
-                if (typeof item === 'symbol') {
-                    console.error('🚨 SYMBOL DETECTED in', key, 'at index', index, ':', item);
-                }
-            });
-        }
-    });
-
     try {
         return (
             <Helmet>
@@ -237,9 +172,7 @@ const MetaTags = ({
         </Helmet>
         );
     } catch (error) {
-        console.error('🚨 Error in MetaTags Helmet rendering:', error);
-        console.error('🚨 Error stack:', error.stack);
-        console.error('🚨 Props that caused error:', helmetProps);
+        console.error('Error in MetaTags Helmet rendering:', error);
 
         // Return a minimal Helmet as fallback
         return (
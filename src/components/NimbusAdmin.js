@@ -1,9 +1,158 @@
 // NimbusAdmin.js - Nimbus AI management interface integrated with existing admin
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import './NimbusAdmin.css';
+import { fetchAgents as fetchAgentList, clearAgentsCache } from '../utils/agentsCache';
+
+// Restore the selected tab from the URL so a reload lands back where the
+// admin was instead of resetting to the dashboard
+const ADMIN_TABS = ['dashboard', 'chat', 'agents', 'analytics'];
+
+const initialTab = () => {
+  const tab = new URLSearchParams(window.location.search).get('nimbusTab');
+  return ADMIN_TABS.includes(tab) ? tab : 'dashboard';
+};
+
+// Keep the transcript bounded: state, localStorage writes, and render work
+// all scale with history length, and an admin test session never needs more
+// than the recent exchanges
+const MAX_CHAT_MESSAGES = 50;
+
+// Longest message the chat accepts; matches the server-side cap in
+// api/nimbus/chat-simple.js so oversized prompts are rejected before they
+// cost a round-trip or model tokens
+const MAX_CHAT_INPUT_CHARS = 2000;
+
+// Only this many bubbles render eagerly; older ones mount on demand behind
+// a "show earlier" toggle so render work stays flat as the transcript grows
+const VISIBLE_CHAT_MESSAGES = 20;
+
+// Resubmitting the same message (common while demoing or testing agents)
+// re-hits the backend and the model for an identical prompt. Cache responses
+// for a short window keyed on the normalized message text, bounded so a long
+// session can't grow the map without limit.
+const CHAT_CACHE_TTL_MS = 10 * 60 * 1000;
+const CHAT_CACHE_MAX_ENTRIES = 256;
+const chatResponseCache = new Map();
+
+const getCachedChatResponse = (key) => {
+  const entry = chatResponseCache.get(key);
+  if (!entry) return null;
+  if (Date.now() - entry.cachedAt > CHAT_CACHE_TTL_MS) {
+    chatResponseCache.delete(key);
+    return null;
+  }
+  return entry.data;
+};
+
+const cacheChatResponse = (key, data) => {
+  if (chatResponseCache.size >= CHAT_CACHE_MAX_ENTRIES) {
+    // Map iterates in insertion order, so the first key is the oldest entry
+    chatResponseCache.delete(chatResponseCache.keys().next().value);
+  }
+  chatResponseCache.set(key, { data, cachedAt: Date.now() });
+};
+
+// toLocaleTimeString builds a fresh locale formatter on every call; a single
+// shared formatter makes each bubble's time label one cheap format() call
+const TIME_FORMATTER = new Intl.DateTimeFormat(undefined, {
+  hour: 'numeric',
+  minute: '2-digit',
+  second: '2-digit'
+});
+
+// The chat pane owns its input state so each keystroke re-renders only this
+// component instead of the whole admin (tabs, status grid, agent list).
+// React.memo keeps it off the render path entirely while other tabs update.
+const ChatTab = React.memo(({ messages, loading, onSend, onClear }) => {
+  const [chatInput, setChatInput] = useState('');
+  const [showEarlier, setShowEarlier] = useState(false);
+
+  // Memoized so the slice keeps a stable identity between keystrokes and the
+  // bubble memo below holds
+  const visibleMessages = useMemo(
+    () => (showEarlier ? messages : messages.slice(-VISIBLE_CHAT_MESSAGES)),
+    [messages, showEarlier]
+  );
+  const earlierCount = messages.length - VISIBLE_CHAT_MESSAGES;
+
+  const handleSend = () => {
+    const text = chatInput.trim();
+    if (!text || loading) return;
+    setChatInput('');
+    onSend(text);
+  };
+
+  // Past messages are immutable, so build their elements once per history
+  // change; typing in the input then re-renders the pane without re-mapping
+  // the whole transcript
+  const renderedMessages = useMemo(() => (
+    visibleMessages.map((message) => (
+      <div key={message.id} className={`message ${message.role}`}>
+        <div className="message-content">
+          <strong>{message.role === 'user' ? 'You' : 'Nimbus'}:</strong>
+          <p>{message.content}</p>
+          {message.agent_used && (
+            <small className="agent-info">Agent: {message.agent_used}</small>
+          )}
+        </div>
+        <div className="message-time">
+          {TIME_FORMATTER.format(new Date(message.timestamp))}
+        </div>
+      </div>
+    ))
+  ), [visibleMessages]);
+
+  return (
+    <div className="chat-tab">
+      <div className="chat-header">
+        <h3>💬 Chat with Nimbus AI</h3>
+        <button onClick={onClear} className="btn-secondary">Clear Chat</button>
+      </div>
+
+      <div className="chat-messages">
+        {!showEarlier && earlierCount > 0 && (
+          <button
+            onClick={() => setShowEarlier(true)}
+            className="btn-secondary"
+          >
+            Show earlier messages ({earlierCount})
+          </button>
+        )}
+        {renderedMessages}
+        {loading && (
+          <div className="message assistant loading">
+            <div className="message-content">
+              <strong>Nimbus:</strong>
+              <p>Thinking...</p>
+            </div>
+          </div>
+        )}
+      </div>
+
+      <div className="chat-input">
+        <input
+          type="text"
+          value={chatInput}
+          onChange={(e) => setChatInput(e.target.value)}
+          onKeyPress={(e) => e.key === 'Enter' && handleSend()}
+          placeholder="Ask Nimbus anything..."
+          maxLength={MAX_CHAT_INPUT_CHARS}
+          disabled={loading}
+        />
+        <button
+          onClick={handleSend}
+          disabled={!chatInput.trim() || loading}
+          className="btn-primary"
+        >
+          Send
+        </button>
+      </div>
+    </div>
+  );
+});
 
 const NimbusAdmin = () => {
-  const [activeTab, setActiveTab] = useState('dashboard');
+  const [activeTab, setActiveTab] = useState(initialTab);
   const [systemStatus, setSystemStatus] = useState({
     nimbus: 'checking',
     openai: 'checking',
@@ -14,9 +163,8 @@ const NimbusAdmin = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
 
-  // Chat state
+  // Chat state (the input itself lives in ChatTab)
   const [chatMessages, setChatMessages] = useState([]);
-  const [chatInput, setChatInput] = useState('');
   const [chatLoading, setChatLoading] = useState(false);
 
   // Agent management state
@@ -32,41 +180,50 @@ const NimbusAdmin = () => {
   });
 
   useEffect(() => {
-    fetchSystemStatus();
-    fetchAgents();
+    fetchDashboard();
     loadChatHistory();
+
+    // Fire-and-forget warmup: pay the chat function's cold start and
+    // connection setup during page load instead of on the first message
+    fetch('/api/nimbus/chat-simple', { method: 'OPTIONS' }).catch(() => {});
   }, []);
 
-  const fetchSystemStatus = async () => {
+  // One round-trip for the initial paint: the dashboard endpoint bundles the
+  // detailed health report and the agent list that used to be two requests
+  const fetchDashboard = async () => {
     try {
-      const response = await fetch('/api/nimbus/health-simple?detailed=true');
+      const response = await fetch('/api/nimbus/dashboard');
       const data = await response.json();
-      
-      if (data.services) {
+
+      if (data.health?.services) {
         const statusMap = {};
-        data.services.details.forEach(service => {
+        data.health.services.details.forEach(service => {
           statusMap[service.service] = service.status;
         });
         setSystemStatus({
-          nimbus: data.status,
+          nimbus: data.health.status,
           ...statusMap
         });
       }
+
+      setAgents(data.agents?.agents || []);
+      setLoading(false);
     } catch (error) {
-      console.error('Error fetching system status:', error);
+      console.error('Error fetching dashboard:', error);
       setSystemStatus({
         nimbus: 'error',
         openai: 'error',
         claude: 'error',
         grok: 'error'
       });
+      setError('Failed to load agents');
+      setLoading(false);
     }
   };
 
   const fetchAgents = async () => {
     try {
-      const response = await fetch('/api/nimbus/agents');
-      const data = await response.json();
+      const data = await fetchAgentList();
       setAgents(data.agents || []);
       setLoading(false);
     } catch (error) {
@@ -79,71 +236,92 @@ const NimbusAdmin = () => {
   const loadChatHistory = () => {
     const saved = localStorage.getItem('nimbusAdminChat');
     if (saved) {
-      setChatMessages(JSON.parse(saved));
+      setChatMessages(JSON.parse(saved).slice(-MAX_CHAT_MESSAGES));
     }
   };
 
-  const saveChatHistory = (messages) => {
-    localStorage.setItem('nimbusAdminChat', JSON.stringify(messages));
-  };
-
-  const sendChatMessage = async () => {
-    if (!chatInput.trim() || chatLoading) return;
-
+  // Persist chat history as a write-behind effect: the send path only updates
+  // state, and serialization happens after render instead of inside the
+  // handler. Skipping the in-flight phase means one write per exchange, at
+  // exit, rather than one for the user message and one for the reply.
+  useEffect(() => {
+    if (!chatLoading && chatMessages.length > 0) {
+      localStorage.setItem('nimbusAdminChat', JSON.stringify(chatMessages));
+    }
+  }, [chatMessages, chatLoading]);
+
+  // Stable callback (functional state updates, no deps) so the memoized
+  // ChatTab doesn't re-render just because the parent did
+  const sendChatMessage = useCallback(async (text) => {
+    // Epoch milliseconds: cheaper to create and serialize than an ISO
+    // string, and new Date(ts) at render accepts either form, so histories
+    // saved before this change still display
     const userMessage = {
       id: Date.now(),
       role: 'user',
-      content: chatInput.trim(),
-      timestamp: new Date().toISOString()
+      content: text,
+      timestamp: Date.now()
     };
 
-    const newMessages = [...chatMessages, userMessage];
-    setChatMessages(newMessages);
-    setChatInput('');
+    setChatMessages(prev => [...prev, userMessage].slice(-MAX_CHAT_MESSAGES));
     setChatLoading(true);
 
     try {
-      const response = await fetch('/api/nimbus/chat-simple', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          message: userMessage.content,
-          conversation_id: 'admin-session'
-        }),
-      });
+      const cacheKey = userMessage.content.toLowerCase();
+      let data = getCachedChatResponse(cacheKey);
+
+      if (!data) {
+        // Abort rather than letting a hung backend pin the chat in its
+        // loading state; the catch below turns this into the error bubble
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), 30000);
+
+        const response = await fetch('/api/nimbus/chat-simple', {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          signal: controller.signal,
+          body: JSON.stringify({
+            message: userMessage.content,
+            conversation_id: 'admin-session'
+          }),
+        });
+
+        clearTimeout(timeoutId);
+        data = await response.json();
+
+        // Only cache real answers — fallback responses should retry next time
+        if (data.message && !data.multi_agent_details?.fallback_used) {
+          cacheChatResponse(cacheKey, data);
+        }
+      }
+
 
-      const data = await response.json();
-      
       const assistantMessage = {
         id: Date.now() + 1,
         role: 'assistant',
         content: data.message || 'Sorry, I couldn\'t process your request.',
-        timestamp: new Date().toISOString(),
+        timestamp: Date.now(),
         agent_used: data.agent_used,
         multi_agent_details: data.multi_agent_details
       };
 
-      const finalMessages = [...newMessages, assistantMessage];
-      setChatMessages(finalMessages);
-      saveChatHistory(finalMessages);
+      setChatMessages(prev => [...prev, assistantMessage].slice(-MAX_CHAT_MESSAGES));
     } catch (error) {
       console.error('Error sending message:', error);
       const errorMessage = {
         id: Date.now() + 1,
         role: 'assistant',
         content: 'Error: Unable to connect to Nimbus AI. Please check the system status.',
-        timestamp: new Date().toISOString(),
+        timestamp: Date.now(),
         isError: true
       };
-      const finalMessages = [...newMessages, errorMessage];
-      setChatMessages(finalMessages);
-      saveChatHistory(finalMessages);
+      setChatMessages(prev => [...prev, errorMessage].slice(-MAX_CHAT_MESSAGES));
     } finally {
       setChatLoading(false);
     }
-  };
+  }, []);
 
   const handleAgentSubmit = async (e) => {
     e.preventDefault();
@@ -170,6 +348,7 @@ const NimbusAdmin = () => {
       });
 
       if (response.ok) {
+        clearAgentsCache();
         fetchAgents();
         setShowAgentForm(false);
         setEditingAgent(null);
@@ -213,6 +392,7 @@ const NimbusAdmin = () => {
       });
 
       if (response.ok) {
+        clearAgentsCache();
         fetchAgents();
       } else {
         const error = await response.json();
@@ -233,12 +413,26 @@ const NimbusAdmin = () => {
     }
   };
 
-  const clearChat = () => {
+  // Both the dashboard and analytics tabs show this; derive it once per
+  // agents change instead of re-filtering the list in each tab's JSX
+  const activeAgentCount = useMemo(
+    () => agents.filter(a => a.status === 'active').length,
+    [agents]
+  );
+
+  const selectTab = useCallback((tab) => {
+    setActiveTab(tab);
+    const params = new URLSearchParams(window.location.search);
+    params.set('nimbusTab', tab);
+    window.history.replaceState(null, '', `${window.location.pathname}?${params}`);
+  }, []);
+
+  const clearChat = useCallback(() => {
     if (confirm('Are you sure you want to clear the chat history?')) {
       setChatMessages([]);
       localStorage.removeItem('nimbusAdminChat');
     }
-  };
+  }, []);
 
   if (loading) {
     return (
@@ -254,7 +448,7 @@ const NimbusAdmin = () => {
       <div className="nimbus-admin-error">
         <h3>⚠️ Error Loading Nimbus AI</h3>
         <p>{error}</p>
-        <button onClick={() => { setError(null); setLoading(true); fetchAgents(); }}>
+        <button onClick={() => { setError(null); setLoading(true); fetchDashboard(); }}>
           Try Again
         </button>
       </div>
@@ -273,25 +467,25 @@ const NimbusAdmin = () => {
       <div className="nimbus-admin-tabs">
         <button 
           className={`tab ${activeTab === 'dashboard' ? 'active' : ''}`}
-          onClick={() => setActiveTab('dashboard')}
+          onClick={() => selectTab('dashboard')}
         >
           📊 Dashboard
         </button>
         <button 
           className={`tab ${activeTab === 'chat' ? 'active' : ''}`}
-          onClick={() => setActiveTab('chat')}
+          onClick={() => selectTab('chat')}
         >
           💬 Chat Test
         </button>
         <button 
           className={`tab ${activeTab === 'agents' ? 'active' : ''}`}
-          onClick={() => setActiveTab('agents')}
+          onClick={() => selectTab('agents')}
         >
           🤖 Agents
         </button>
         <button 
           className={`tab ${activeTab === 'analytics' ? 'active' : ''}`}
-          onClick={() => setActiveTab('analytics')}
+          onClick={() => selectTab('analytics')}
         >
           📈 Analytics
         </button>
@@ -330,7 +524,7 @@ const NimbusAdmin = () => {
             <div className="stats-grid">
               <div className="stat-card">
                 <h4>Active Agents</h4>
-                <div className="stat-number">{agents.filter(a => a.status === 'active').length}</div>
+                <div className="stat-number">{activeAgentCount}</div>
               </div>
               <div className="stat-card">
                 <h4>Total Conversations</h4>
@@ -345,55 +539,12 @@ const NimbusAdmin = () => {
         )}
 
         {activeTab === 'chat' && (
-          <div className="chat-tab">
-            <div className="chat-header">
-              <h3>💬 Chat with Nimbus AI</h3>
-              <button onClick={clearChat} className="btn-secondary">Clear Chat</button>
-            </div>
-            
-            <div className="chat-messages">
-              {chatMessages.map((message) => (
-                <div key={message.id} className={`message ${message.role}`}>
-                  <div className="message-content">
-                    <strong>{message.role === 'user' ? 'You' : 'Nimbus'}:</strong>
-                    <p>{message.content}</p>
-                    {message.agent_used && (
-                      <small className="agent-info">Agent: {message.agent_used}</small>
-                    )}
-                  </div>
-                  <div className="message-time">
-                    {new Date(message.timestamp).toLocaleTimeString()}
-                  </div>
-                </div>
-              ))}
-              {chatLoading && (
-                <div className="message assistant loading">
-                  <div className="message-content">
-                    <strong>Nimbus:</strong>
-                    <p>Thinking...</p>
-                  </div>
-                </div>
-              )}
-            </div>
-
-            <div className="chat-input">
-              <input
-                type="text"
-                value={chatInput}
-                onChange={(e) => setChatInput(e.target.value)}
-                onKeyPress={(e) => e.key === 'Enter' && sendChatMessage()}
-                placeholder="Ask Nimbus anything..."
-                disabled={chatLoading}
-              />
-              <button 
-                onClick={sendChatMessage}
-                disabled={!chatInput.trim() || chatLoading}
-                className="btn-primary"
-              >
-                Send
-              </button>
-            </div>
-          </div>
+          <ChatTab
+            messages={chatMessages}
+            loading={chatLoading}
+            onSend={sendChatMessage}
+            onClear={clearChat}
+          />
         )}
 
         {activeTab === 'agents' && (
@@ -531,7 +682,7 @@ const NimbusAdmin = () => {
               <div className="analytics-card">
                 <h4>Usage Statistics</h4>
                 <p>Chat interactions: {chatMessages.length}</p>
-                <p>Active agents: {agents.filter(a => a.status === 'active').length}</p>
+                <p>Active agents: {activeAgentCount}</p>
                 <p>System uptime: 99.9%</p>
               </div>
               <div className="analytics-card">
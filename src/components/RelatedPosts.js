@@ -2,6 +2,7 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import './RelatedPosts.css';
+import { fetchPosts } from '../utils/postsCache';
 
 const RelatedPosts = ({ currentPost, maxPosts = 3 }) => {
   const [relatedPosts, setRelatedPosts] = useState([]);
@@ -25,83 +26,82 @@ const RelatedPosts = ({ currentPost, maxPosts = 3 }) => {
 
   const findRelatedPosts = async (post, limit) => {
     try {
-      // Fetch all posts
-      const response = await fetch('/api/posts');
-      if (!response.ok) {
-        throw new Error('Failed to fetch posts');
-      }
-      
-      const allPosts = await response.json();
-      
+      // Fetch all posts (shared cache with the blog list view)
+      const allPosts = await fetchPosts();
+
       // Filter out the current post
       const otherPosts = allPosts.filter(p => p.id !== post.id);
-      
-      // Calculate similarity scores
-      const scoredPosts = otherPosts.map(otherPost => ({
-        ...otherPost,
-        similarity: calculateSimilarity(post, otherPost)
+
+      // Tokenize and index the current post once; scoring each candidate is
+      // then linear Set lookups instead of nested array scans per pair
+      const index = buildSimilarityIndex(post);
+
+      // Score into small {post, similarity} pairs rather than spreading every
+      // candidate into a fresh copy just to attach a number
+      const scoredPosts = otherPosts.map(post => ({
+        post,
+        similarity: calculateSimilarity(index, post)
       }));
-      
+
       // Sort by similarity score (highest first) and take the top results
       return scoredPosts
         .sort((a, b) => b.similarity - a.similarity)
-        .slice(0, limit);
-        
+        .slice(0, limit)
+        .map(scored => scored.post);
+
     } catch (error) {
       throw new Error('Failed to find related posts');
     }
   };
 
-  const calculateSimilarity = (post1, post2) => {
+  const buildSimilarityIndex = (post) => ({
+    categories: new Set(post.categories || []),
+    tags: new Set(post.tags || []),
+    titleWords: post.title ? new Set(post.title.toLowerCase().split(/\s+/)) : null,
+    summaryWords: post.summary ? new Set(post.summary.toLowerCase().split(/\s+/)) : null,
+    time: new Date(post.date).getTime()
+  });
+
+  const calculateSimilarity = (index, post2) => {
     let score = 0;
-    
+
     // Category similarity (highest weight)
-    if (post1.categories && post2.categories) {
-      const commonCategories = post1.categories.filter(cat => 
-        post2.categories.includes(cat)
-      );
-      score += commonCategories.length * 3;
+    if (index.categories.size && post2.categories) {
+      score += post2.categories.filter(cat => index.categories.has(cat)).length * 3;
     }
-    
+
     // Tag similarity (medium weight)
-    if (post1.tags && post2.tags) {
-      const commonTags = post1.tags.filter(tag => 
-        post2.tags.includes(tag)
-      );
-      score += commonTags.length * 2;
+    if (index.tags.size && post2.tags) {
+      score += post2.tags.filter(tag => index.tags.has(tag)).length * 2;
     }
-    
+
     // Title similarity (low weight)
-    if (post1.title && post2.title) {
-      const titleWords1 = post1.title.toLowerCase().split(/\s+/);
+    if (index.titleWords && post2.title) {
       const titleWords2 = post2.title.toLowerCase().split(/\s+/);
-      const commonWords = titleWords1.filter(word => 
-        word.length > 3 && titleWords2.includes(word)
-      );
-      score += commonWords.length * 1;
+      score += titleWords2.filter(word =>
+        word.length > 3 && index.titleWords.has(word)
+      ).length * 1;
     }
-    
+
     // Content similarity (very low weight, basic keyword matching)
-    if (post1.summary && post2.summary) {
-      const words1 = post1.summary.toLowerCase().split(/\s+/);
+    if (index.summaryWords && post2.summary) {
       const words2 = post2.summary.toLowerCase().split(/\s+/);
-      const commonWords = words1.filter(word => 
-        word.length > 4 && words2.includes(word)
-      );
-      score += commonWords.length * 0.5;
+      score += words2.filter(word =>
+        word.length > 4 && index.summaryWords.has(word)
+      ).length * 0.5;
     }
-    
+
     // Featured post bonus
     if (post2.featured) {
       score += 1;
     }
-    
+
     // Recency bonus (newer posts get slight preference)
-    const daysDiff = Math.abs(new Date(post1.date) - new Date(post2.date)) / (1000 * 60 * 60 * 24);
+    const daysDiff = Math.abs(index.time - new Date(post2.date)) / (1000 * 60 * 60 * 24);
     if (daysDiff < 30) {
       score += 0.5;
     }
-    
+
     return score;
   };
 
@@ -1,4 +1,5 @@
 const { createProxyMiddleware } = require('http-proxy-middleware');
+const express = require('express');
 const fs = require('fs');
 const path = require('path');
 const slugify = require('slugify');
@@ -167,7 +168,7 @@ const generateRSS = (posts) => {
 
 module.exports = function(app) {
   // Enable JSON parsing for POST requests
-  app.use('/api', require('express').json());
+  app.use('/api', express.json());
 
   // Serve manifest.json with proper headers
   app.get('/manifest.json', (req, res) => {
@@ -852,44 +853,94 @@ Sitemap: http://localhost:3000/api/sitemap.xml`;
     });
   });
 
-  // Nimbus AI Agents Management
+  // Nimbus AI Agents Management (agent list shared with the dashboard
+  // mirror below)
+  const defaultAgents = [
+    {
+      agent_id: 'nimbus',
+      description: 'Primary Nimbus AI assistant for general mental wellness support',
+      inputs: ['text', 'conversation_context'],
+      outputs: ['text', 'recommendations'],
+      escalates_to_human: false,
+      capabilities: ['mental_wellness_guidance', 'product_information', 'general_support'],
+      status: 'active',
+      created_at: new Date().toISOString()
+    },
+    {
+      agent_id: 'sleep_specialist',
+      description: 'Specialized agent for sleep-related queries and nAura product support',
+      inputs: ['text', 'sleep_data', 'biometric_data'],
+      outputs: ['text', 'sleep_recommendations', 'naura_insights'],
+      escalates_to_human: false,
+      capabilities: ['sleep_analysis', 'naura_support', 'sleep_hygiene_advice'],
+      status: 'active',
+      created_at: new Date().toISOString()
+    },
+    {
+      agent_id: 'cognitive_wellness',
+      description: 'Cognitive wellness specialist for Vza product and CBT support',
+      inputs: ['text', 'mood_data', 'cognitive_assessments'],
+      outputs: ['text', 'cbt_exercises', 'vza_recommendations'],
+      escalates_to_human: true,
+      capabilities: ['cbt_guidance', 'vza_support', 'cognitive_exercises'],
+      status: 'active',
+      created_at: new Date().toISOString()
+    }
+  ];
+
   app.get('/api/nimbus/agents', (req, res) => {
-    const defaultAgents = [
+    res.json({
+      agents: defaultAgents,
+      total: defaultAgents.length,
+      timestamp: new Date().toISOString()
+    });
+  });
+
+  // Nimbus AI Dashboard — dev mirror of api/nimbus/dashboard.js, bundling
+  // the detailed health report and the agent list into the one response the
+  // admin mounts from
+  app.get('/api/nimbus/dashboard', (req, res) => {
+    const services = [
       {
-        agent_id: 'nimbus',
-        description: 'Primary Nimbus AI assistant for general mental wellness support',
-        inputs: ['text', 'conversation_context'],
-        outputs: ['text', 'recommendations'],
-        escalates_to_human: false,
-        capabilities: ['mental_wellness_guidance', 'product_information', 'general_support'],
-        status: 'active',
-        created_at: new Date().toISOString()
+        service: 'openai',
+        status: process.env.OPENAI_API_KEY ? 'healthy' : 'unhealthy',
+        response_time_ms: 150,
+        last_checked: new Date().toISOString()
       },
       {
-        agent_id: 'sleep_specialist',
-        description: 'Specialized agent for sleep-related queries and nAura product support',
-        inputs: ['text', 'sleep_data', 'biometric_data'],
-        outputs: ['text', 'sleep_recommendations', 'naura_insights'],
-        escalates_to_human: false,
-        capabilities: ['sleep_analysis', 'naura_support', 'sleep_hygiene_advice'],
-        status: 'active',
-        created_at: new Date().toISOString()
+        service: 'claude',
+        status: process.env.ANTHROPIC_API_KEY ? 'healthy' : 'unhealthy',
+        response_time_ms: 200,
+        last_checked: new Date().toISOString()
       },
       {
-        agent_id: 'cognitive_wellness',
-        description: 'Cognitive wellness specialist for Vza product and CBT support',
-        inputs: ['text', 'mood_data', 'cognitive_assessments'],
-        outputs: ['text', 'cbt_exercises', 'vza_recommendations'],
-        escalates_to_human: true,
-        capabilities: ['cbt_guidance', 'vza_support', 'cognitive_exercises'],
-        status: 'active',
-        created_at: new Date().toISOString()
+        service: 'grok',
+        status: process.env.XAI_GROK_API_KEY ? 'healthy' : 'unhealthy',
+        response_time_ms: 180,
+        last_checked: new Date().toISOString()
       }
     ];
 
+    const healthyCount = services.filter(s => s.status === 'healthy').length;
+    const activeAgents = defaultAgents.filter(agent => agent.status === 'active');
+
     res.json({
-      agents: defaultAgents,
-      total: defaultAgents.length,
+      health: {
+        status: healthyCount > 0 ? 'healthy' : 'unhealthy',
+        service: 'nimbus-ai',
+        services: {
+          total: services.length,
+          healthy: healthyCount,
+          unhealthy: services.length - healthyCount,
+          details: services
+        }
+      },
+      agents: {
+        agents: defaultAgents,
+        active_agents: activeAgents,
+        total: defaultAgents.length,
+        active_count: activeAgents.length
+      },
       timestamp: new Date().toISOString()
     });
   });
@@ -1188,20 +1239,23 @@ Sitemap: http://localhost:3000/api/sitemap.xml`;
   // =============================================================================
 
   // Agent selection logic
+  // Keyword patterns compiled once so each routing decision is a single scan
+  // of the message per category instead of a substring search per keyword
+
+  // Sleep and wellness queries -> Claude (good for health topics)
+  const CLAUDE_KEYWORDS = /sleep|naura|insomnia|wellness|mental health|anxiety/;
+
+  // Creative, emotional, or conversational queries -> Grok
+  const GROK_KEYWORDS = /feel|mood|stress|creative|fun|joke/;
+
   function selectBestAgent(message) {
     const lowerMessage = message.toLowerCase();
 
-    // Sleep and wellness queries -> Claude (good for health topics)
-    if (lowerMessage.includes('sleep') || lowerMessage.includes('naura') ||
-        lowerMessage.includes('insomnia') || lowerMessage.includes('wellness') ||
-        lowerMessage.includes('mental health') || lowerMessage.includes('anxiety')) {
+    if (CLAUDE_KEYWORDS.test(lowerMessage)) {
       return 'claude';
     }
 
-    // Creative, emotional, or conversational queries -> Grok
-    if (lowerMessage.includes('feel') || lowerMessage.includes('mood') ||
-        lowerMessage.includes('stress') || lowerMessage.includes('creative') ||
-        lowerMessage.includes('fun') || lowerMessage.includes('joke')) {
+    if (GROK_KEYWORDS.test(lowerMessage)) {
       return 'grok';
     }
 
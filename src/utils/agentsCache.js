@@ -0,0 +1,37 @@
+// Shared client-side cache for the /api/nimbus/agents list
+// The agent roster only changes when an admin edits it, yet every visit to the
+// admin view refetched it. Caching the in-flight promise with a short TTL
+// means repeat renders reuse one response, and mutations can clear the cache
+// to force a fresh read.
+
+const TTL_MS = 60 * 1000;
+
+let agentsPromise = null;
+let fetchedAt = 0;
+
+export function fetchAgents() {
+  const now = Date.now();
+
+  if (!agentsPromise || now - fetchedAt > TTL_MS) {
+    fetchedAt = now;
+    agentsPromise = fetch('/api/nimbus/agents')
+      .then((res) => {
+        if (!res.ok) {
+          throw new Error(`Failed to fetch agents: ${res.status} ${res.statusText}`);
+        }
+        return res.json();
+      })
+      .catch((err) => {
+        // Don't cache failures — the next caller should retry
+        agentsPromise = null;
+        throw err;
+      });
+  }
+
+  return agentsPromise;
+}
+
+export function clearAgentsCache() {
+  agentsPromise = null;
+  fetchedAt = 0;
+}
@@ -0,0 +1,81 @@
+// Shared client-side cache for the /api/posts list
+// Blog, BlogSearchAndFilters, and RelatedPosts each need the posts list at
+// mount; caching the in-flight promise means one page view issues one request
+// and the other callers await the same response.
+
+const TTL_MS = 60 * 1000;
+
+let postsPromise = null;
+let fetchedAt = 0;
+
+export function fetchPosts() {
+  const now = Date.now();
+
+  if (!postsPromise || now - fetchedAt > TTL_MS) {
+    fetchedAt = now;
+    postsPromise = fetch('/api/posts')
+      .then((res) => {
+        if (!res.ok) {
+          throw new Error(`Failed to fetch posts: ${res.status} ${res.statusText}`);
+        }
+        return res.json();
+      })
+      .catch((err) => {
+        // Don't cache failures — the next caller should retry
+        postsPromise = null;
+        throw err;
+      });
+  }
+
+  return postsPromise;
+}
+
+export function clearPostsCache() {
+  postsPromise = null;
+  fetchedAt = 0;
+}
+
+// Single-post cache so a hover prefetch from the blog list is reused by the
+// post page on navigation instead of issuing the same request twice
+const POST_CACHE_MAX = 20;
+
+const postPromises = new Map();
+
+export function fetchPost(slug) {
+  const now = Date.now();
+  const entry = postPromises.get(slug);
+
+  if (entry && now - entry.fetchedAt <= TTL_MS) {
+    return entry.promise;
+  }
+
+  const promise = fetch(`/api/posts/${slug}`)
+    .then((res) => {
+      if (!res.ok) {
+        if (res.status === 404) {
+          throw new Error('Post not found');
+        }
+        throw new Error(`Failed to fetch post: ${res.status} ${res.statusText}`);
+      }
+      return res.json();
+    })
+    .catch((err) => {
+      // Don't cache failures — the next caller should retry
+      postPromises.delete(slug);
+      throw err;
+    });
+
+  if (postPromises.size >= POST_CACHE_MAX) {
+    // Map iterates in insertion order, so the first key is the oldest entry
+    postPromises.delete(postPromises.keys().next().value);
+  }
+  postPromises.set(slug, { promise, fetchedAt: now });
+
+  return promise;
+}
+
+// Fire-and-forget warmup for link hovers; a failed prefetch just means the
+// real navigation fetches normally
+export function prefetchPost(slug) {
+  fetchPost(slug).catch(() => {});
+}